@@ -9,7 +9,6 @@ regarding supplier sustainability assessment thresholds.
 """
 
 import streamlit as st
-import numpy as np
 
 # Configure page - must be first Streamlit command
 st.set_page_config(
@@ -25,6 +24,7 @@ from data.exhibits import (
     GEOGRAPHIC_FAIRNESS,
     SAMPLE_SIZES,
     STANDARD_THRESHOLDS,
+    STANDARD_THRESHOLDS_DISPLAY,
     STAKEHOLDER_PREFERENCES,
     TOTAL_SUPPLIERS
 )
@@ -36,10 +36,190 @@ from utils.calculations import (
     get_delta_vs_reference,
     is_standard_threshold
 )
-from utils.visualizations import (
-    create_cost_risk_chart,
-    create_geographic_fairness_chart,
-    COLORS
+from utils.constants import COLORS
+
+# Stakeholder card templates: brand colors are baked in once at import, leaving
+# only the per-threshold fields to fill in on each render
+_CFO_CARD_TMPL = f"""
+    <div style='
+        border: 1px solid {COLORS["neutral"]};
+        border-radius: 10px;
+        padding: 15px;
+        margin-bottom: 10px;
+        background-color: white;
+    '>
+        <div style='font-size: 16px; font-weight: bold; color: {COLORS["primary"]}; border-bottom: 1px solid {COLORS["neutral"]}; padding-bottom: 8px; margin-bottom: 10px;'>
+            {{role}} ({{name}}) - {{focus}}
+        </div>
+        <div style='font-size: 14px; color: {COLORS["primary"]}; margin-bottom: 6px;'>
+            <strong>Prefers:</strong> Threshold {{preferred_threshold:.2f}} (${{preferred_cost:.1f}}M)
+        </div>
+        <div style='font-size: 14px; color: {COLORS["primary"]}; margin-bottom: 6px;'>
+            <strong>Current:</strong> Threshold {{threshold:.2f}} (${{current_cost:.1f}}M)
+        </div>
+        <div style='font-size: 14px; color: {COLORS["primary"]}; margin-bottom: 12px;'>
+            <strong>Gap:</strong> +${{cost_gap:.1f}}M (+{{cost_gap_pct:.0f}}% more expensive)
+        </div>
+        <div style='
+            font-size: 14px;
+            color: #555;
+            font-style: italic;
+            border-left: 3px solid {COLORS["secondary"]};
+            padding-left: 10px;
+        '>
+            "{{quote}}"
+        </div>
+    </div>
+    """
+
+_CSO_CARD_TMPL = f"""
+    <div style='
+        border: 1px solid {COLORS["neutral"]};
+        border-radius: 10px;
+        padding: 15px;
+        margin-bottom: 10px;
+        background-color: white;
+    '>
+        <div style='font-size: 16px; font-weight: bold; color: {COLORS["primary"]}; border-bottom: 1px solid {COLORS["neutral"]}; padding-bottom: 8px; margin-bottom: 10px;'>
+            {{role}} ({{name}}) - {{focus}}
+        </div>
+        <div style='font-size: 14px; color: {COLORS["primary"]}; margin-bottom: 6px;'>
+            <strong>Prefers:</strong> Threshold {{preferred_threshold:.2f}} ({{preferred_fn}} false negatives)
+        </div>
+        <div style='font-size: 14px; color: {COLORS["primary"]}; margin-bottom: 6px;'>
+            <strong>Current:</strong> Threshold {{threshold:.2f}} ({{current_fn}} false negatives)
+        </div>
+        <div style='font-size: 14px; color: {COLORS["primary"]}; margin-bottom: 12px;'>
+            <strong>Gap:</strong> +{{fn_gap}} missed risks (+{{fn_gap_pct:.0f}}% more)
+        </div>
+        <div style='
+            font-size: 14px;
+            color: #555;
+            font-style: italic;
+            border-left: 3px solid {COLORS["secondary"]};
+            padding-left: 10px;
+        '>
+            "{{quote}}"
+        </div>
+    </div>
+    """
+
+_RELATIONS_CARD_TMPL = f"""
+    <div style='
+        border: 1px solid {COLORS["neutral"]};
+        border-radius: 10px;
+        padding: 15px;
+        margin-bottom: 10px;
+        background-color: white;
+    '>
+        <div style='font-size: 16px; font-weight: bold; color: {COLORS["primary"]}; border-bottom: 1px solid {COLORS["neutral"]}; padding-bottom: 8px; margin-bottom: 10px;'>
+            {{role}} ({{name}}) - {{focus}}
+        </div>
+        <div style='font-size: 14px; color: {COLORS["primary"]}; margin-bottom: 12px;'>
+            <strong>Current:</strong> {{flagged_pct:.0f}}% flagged ({{flagged_count}} suppliers)
+        </div>
+        <div style='
+            font-size: 14px;
+            color: #555;
+            font-style: italic;
+            border-left: 3px solid {COLORS["secondary"]};
+            padding-left: 10px;
+        '>
+            "{{quote}}"
+        </div>
+    </div>
+    """
+
+_COUNSEL_CARD_TMPL = f"""
+    <div style='
+        border: 1px solid {COLORS["neutral"]};
+        border-radius: 10px;
+        padding: 15px;
+        margin-bottom: 10px;
+        background-color: white;
+    '>
+        <div style='font-size: 16px; font-weight: bold; color: {COLORS["primary"]}; border-bottom: 1px solid {COLORS["neutral"]}; padding-bottom: 8px; margin-bottom: 10px;'>
+            {{role}} ({{name}}) - {{focus}}
+        </div>
+        <div style='font-size: 14px; color: {COLORS["primary"]}; margin-bottom: 6px;'>
+            <strong>Geographic disparity:</strong> {{disparity:.1f}} percentage points
+        </div>
+        <div style='font-size: 13px; color: {COLORS["primary"]}; margin-bottom: 4px;'>
+            (China: {{china_rate:.1f}}% | n=1,172)
+        </div>
+        <div style='font-size: 13px; color: {COLORS["primary"]}; margin-bottom: 4px;'>
+            (India: {{india_rate:.1f}}% | n=60)
+        </div>
+        <div style='font-size: 13px; color: {COLORS["primary"]}; margin-bottom: 12px;'>
+            (Other: {{other_rate:.1f}}% | n=14)
+        </div>
+        <div style='
+            font-size: 14px;
+            color: #555;
+            font-style: italic;
+            border-left: 3px solid {COLORS["secondary"]};
+            padding-left: 10px;
+        '>
+            "{{quote}}"
+        </div>
+    </div>
+    """
+
+
+# Static markdown shown on every rerun, built once at import
+_THRESHOLD_EXPLAINER_MD = """
+    **Threshold** refers to the probability cutoff used by the predictive model to flag
+    suppliers for detailed sustainability review.
+
+    - **Lower threshold (e.g., 0.50)**: More suppliers flagged = higher cost, fewer missed risks
+    - **Higher threshold (e.g., 0.70)**: Fewer suppliers flagged = lower cost, more missed risks
+
+    The model outputs a probability (0-1) for each supplier. If the probability exceeds
+    the threshold, that supplier is flagged for manual review.
+
+    **Key terms:**
+    - **False Positive (FP)**: A good supplier incorrectly flagged for review (wastes resources)
+    - **False Negative (FN)**: A problematic supplier missed by the model (creates risk)
+    """
+
+_DISCUSSION_PROMPTS_MD = """
+    Use these questions to guide your case analysis:
+
+    1. **Stakeholder Priorities:** Which stakeholder's concerns should matter most to Philips?
+       How would you weigh cost savings against risk mitigation?
+
+    2. **Geographic Fairness:** Is the disparity in flagging rates between regions acceptable?
+       Why or why not? What are the ethical implications?
+
+    3. **Regional Thresholds:** Should Philips consider using different thresholds by region
+       to achieve more equitable outcomes? What are the trade-offs?
+
+    4. **Worst Case Scenario:** What would happen if Philips misses a major sustainability
+       violation at a supplier? How should this risk factor into the threshold decision?
+
+    5. **Board Justification:** How would you justify your recommended threshold to the
+       Philips board of directors? What data would you present?
+
+    6. **Implementation:** Beyond the threshold, what other safeguards or processes should
+       Philips implement to manage supplier sustainability risk?
+
+    7. **Model Limitations:** What are the limitations of using a predictive model for this
+       decision? When might human judgment be more appropriate?
+    """
+
+# Regional disparity messages, filled in with the current disparity
+_HIGH_DISPARITY_MSG = (
+    "⚠️ **High Disparity Warning:** The {disparity:.1f}pp difference in flagging rates "
+    "between regions may indicate disparate impact. This could expose Philips to "
+    "regulatory scrutiny or reputational risk."
+)
+_MODERATE_DISPARITY_MSG = (
+    "⚠️ **Moderate Disparity:** The {disparity:.1f}pp difference in flagging rates "
+    "between regions warrants monitoring."
+)
+_LOW_DISPARITY_MSG = (
+    "✅ **Low Disparity:** The {disparity:.1f}pp difference in flagging rates "
+    "indicates relatively balanced treatment across regions."
 )
 
 
@@ -64,25 +244,12 @@ def render_header():
     """)
 
     with st.expander("ℹ️ What is a threshold?"):
-        st.markdown("""
-        **Threshold** refers to the probability cutoff used by the predictive model to flag
-        suppliers for detailed sustainability review.
-
-        - **Lower threshold (e.g., 0.50)**: More suppliers flagged = higher cost, fewer missed risks
-        - **Higher threshold (e.g., 0.70)**: Fewer suppliers flagged = lower cost, more missed risks
-
-        The model outputs a probability (0-1) for each supplier. If the probability exceeds
-        the threshold, that supplier is flagged for manual review.
-
-        **Key terms:**
-        - **False Positive (FP)**: A good supplier incorrectly flagged for review (wastes resources)
-        - **False Negative (FN)**: A problematic supplier missed by the model (creates risk)
-        """)
+        st.markdown(_THRESHOLD_EXPLAINER_MD)
 
 
 def render_threshold_selector() -> float:
     """Render the threshold selector with slider and quick-select buttons."""
-    st.markdown("### Select Threshold")
+    st.markdown("---\n### Select Threshold")
 
     # Initialize session state for threshold if not exists
     if "threshold" not in st.session_state:
@@ -115,6 +282,10 @@ def render_threshold_selector() -> float:
         key="threshold_slider"
     )
 
+    # Snap to the 0.01 grid so float noise (e.g. 0.6100000000000001) doesn't
+    # miss exhibit lookups or create extra cache entries downstream
+    threshold = round(threshold, 2)
+
     # Update session state
     st.session_state.threshold = threshold
 
@@ -122,19 +293,18 @@ def render_threshold_selector() -> float:
     if not is_standard_threshold(threshold):
         st.warning(
             "⚠️ **Interpolated values** - This threshold is not in the standard set "
-            f"({', '.join(str(t) for t in STANDARD_THRESHOLDS)}). "
+            f"({STANDARD_THRESHOLDS_DISPLAY}). "
             "Displayed values are estimated through linear interpolation and do not represent actual model output."
         )
 
     return threshold
 
 
-def render_metric_cards(threshold: float):
+def render_metric_cards(threshold: float, metrics: dict):
     """Render the key metrics cards."""
-    st.markdown("### Key Metrics")
+    st.markdown("---\n### Key Metrics")
 
-    metrics = get_metrics_for_threshold(threshold)
-    deltas = get_delta_vs_reference(threshold, reference_threshold=0.60)
+    deltas = get_delta_vs_reference(threshold)
 
     col1, col2, col3, col4 = st.columns(4)
 
@@ -175,9 +345,15 @@ def render_metric_cards(threshold: float):
 
 def render_cost_risk_chart(threshold: float):
     """Render the cost vs. risk trade-off chart."""
+    # Deferred so Plotly only loads once a chart is rendered
+    from utils.visualizations import create_cost_risk_chart
+
     st.markdown("### Cost vs. Risk Trade-off")
 
     fig = create_cost_risk_chart(threshold)
+    # Kept on st.plotly_chart rather than pre-serialized JSON in an HTML
+    # component: the figure is already cached and orjson-encoded, and this
+    # keeps Streamlit's theming, container width and bundled Plotly.js
     st.plotly_chart(fig, use_container_width=True)
 
     st.info(
@@ -187,46 +363,37 @@ def render_cost_risk_chart(threshold: float):
     )
 
 
-def render_geographic_fairness_chart(threshold: float):
+def render_geographic_fairness_chart(threshold: float, rates: dict):
     """Render the geographic fairness chart."""
+    from utils.visualizations import create_geographic_fairness_chart
+
     st.markdown("### Geographic Fairness Analysis")
 
     fig = create_geographic_fairness_chart(threshold)
     st.plotly_chart(fig, use_container_width=True)
 
     # Calculate and display disparity
-    rates = get_geographic_rates_for_threshold(threshold)
-    disparity = max(rates.values()) - min(rates.values())
+    disparity = calculate_geographic_disparity(threshold)
 
     col1, col2 = st.columns(2)
 
     with col1:
-        st.markdown(f"""
-        **Current Regional Rates (threshold ≈ {threshold:.2f}):**
-        - China: {rates.get('China', rates.get(list(rates.keys())[0])):.1f}%
-        - India: {rates.get('India', rates.get(list(rates.keys())[1])):.1f}%
-        - Other: {rates.get('Other', rates.get(list(rates.keys())[2])):.1f}%
-
-        **Maximum Disparity:** {disparity:.1f} percentage points
-        """)
+        st.markdown("\n".join([
+            f"**Current Regional Rates (threshold ≈ {threshold:.2f}):**",
+            f"- China: {rates['China']:.1f}%",
+            f"- India: {rates['India']:.1f}%",
+            f"- Other: {rates['Other']:.1f}%",
+            "",
+            f"**Maximum Disparity:** {disparity:.1f} percentage points"
+        ]))
 
     with col2:
         if disparity > 20:
-            st.error(
-                f"⚠️ **High Disparity Warning:** The {disparity:.1f}pp difference in flagging rates "
-                "between regions may indicate disparate impact. This could expose Philips to "
-                "regulatory scrutiny or reputational risk."
-            )
+            st.error(_HIGH_DISPARITY_MSG.format(disparity=disparity))
         elif disparity > 10:
-            st.warning(
-                f"⚠️ **Moderate Disparity:** The {disparity:.1f}pp difference in flagging rates "
-                "between regions warrants monitoring."
-            )
+            st.warning(_MODERATE_DISPARITY_MSG.format(disparity=disparity))
         else:
-            st.success(
-                f"✅ **Low Disparity:** The {disparity:.1f}pp difference in flagging rates "
-                "indicates relatively balanced treatment across regions."
-            )
+            st.success(_LOW_DISPARITY_MSG.format(disparity=disparity))
 
     st.caption(
         "**Note:** The 'Other' region has only n=14 suppliers. "
@@ -234,32 +401,24 @@ def render_geographic_fairness_chart(threshold: float):
     )
 
 
-def render_stakeholder_perspectives(threshold: float):
+def render_stakeholder_perspectives(threshold: float, metrics: dict, rates: dict):
     """Render neutral stakeholder perspective cards without status indicators."""
     st.markdown(
-        f"### Stakeholder Perspectives at Threshold {threshold:.2f}",
+        f"---\n### Stakeholder Perspectives at Threshold {threshold:.2f}",
     )
 
-    perspectives = get_stakeholder_perspectives(threshold)
-
-    # Create two rows of two columns each for the four stakeholders
-    col1, col2 = st.columns(2)
-
-    # First row: CFO and CSO
-    with col1:
-        render_cfo_card(perspectives["cfo"], threshold)
+    perspectives = get_stakeholder_perspectives(threshold, metrics, rates)
 
-    with col2:
-        render_cso_card(perspectives["cso"], threshold)
-
-    col3, col4 = st.columns(2)
-
-    # Second row: Supplier Relations and General Counsel
-    with col3:
-        render_relations_card(perspectives["relations"])
-
-    with col4:
-        render_counsel_card(perspectives["counsel"])
+    # Two rows of two columns each: CFO and CSO, then Supplier Relations
+    # and General Counsel
+    for row in range(0, len(_CARD_RENDERERS), 2):
+        cols = st.columns(2)
+        for col, (key, render_card, needs_threshold) in zip(cols, _CARD_RENDERERS[row:row + 2]):
+            with col:
+                if needs_threshold:
+                    render_card(perspectives[key], threshold)
+                else:
+                    render_card(perspectives[key])
 
     # Key insight at bottom
     st.markdown("---")
@@ -272,37 +431,7 @@ def render_stakeholder_perspectives(threshold: float):
 def render_cfo_card(cfo: dict, threshold: float):
     """Render the CFO perspective card."""
     st.markdown(
-        f"""
-        <div style='
-            border: 1px solid {COLORS["neutral"]};
-            border-radius: 10px;
-            padding: 15px;
-            margin-bottom: 10px;
-            background-color: white;
-        '>
-            <div style='font-size: 16px; font-weight: bold; color: {COLORS["primary"]}; border-bottom: 1px solid {COLORS["neutral"]}; padding-bottom: 8px; margin-bottom: 10px;'>
-                {cfo["role"]} ({cfo["name"]}) - {cfo["focus"]}
-            </div>
-            <div style='font-size: 14px; color: {COLORS["primary"]}; margin-bottom: 6px;'>
-                <strong>Prefers:</strong> Threshold {cfo["preferred_threshold"]:.2f} (${cfo["preferred_cost"]:.1f}M)
-            </div>
-            <div style='font-size: 14px; color: {COLORS["primary"]}; margin-bottom: 6px;'>
-                <strong>Current:</strong> Threshold {threshold:.2f} (${cfo["current_cost"]:.1f}M)
-            </div>
-            <div style='font-size: 14px; color: {COLORS["primary"]}; margin-bottom: 12px;'>
-                <strong>Gap:</strong> +${cfo["cost_gap"]:.1f}M (+{cfo["cost_gap_pct"]:.0f}% more expensive)
-            </div>
-            <div style='
-                font-size: 14px;
-                color: #555;
-                font-style: italic;
-                border-left: 3px solid {COLORS["secondary"]};
-                padding-left: 10px;
-            '>
-                "{cfo["quote"]}"
-            </div>
-        </div>
-        """,
+        _CFO_CARD_TMPL.format_map(cfo | {"threshold": threshold}),
         unsafe_allow_html=True
     )
 
@@ -310,37 +439,7 @@ def render_cfo_card(cfo: dict, threshold: float):
 def render_cso_card(cso: dict, threshold: float):
     """Render the CSO perspective card."""
     st.markdown(
-        f"""
-        <div style='
-            border: 1px solid {COLORS["neutral"]};
-            border-radius: 10px;
-            padding: 15px;
-            margin-bottom: 10px;
-            background-color: white;
-        '>
-            <div style='font-size: 16px; font-weight: bold; color: {COLORS["primary"]}; border-bottom: 1px solid {COLORS["neutral"]}; padding-bottom: 8px; margin-bottom: 10px;'>
-                {cso["role"]} ({cso["name"]}) - {cso["focus"]}
-            </div>
-            <div style='font-size: 14px; color: {COLORS["primary"]}; margin-bottom: 6px;'>
-                <strong>Prefers:</strong> Threshold {cso["preferred_threshold"]:.2f} ({cso["preferred_fn"]} false negatives)
-            </div>
-            <div style='font-size: 14px; color: {COLORS["primary"]}; margin-bottom: 6px;'>
-                <strong>Current:</strong> Threshold {threshold:.2f} ({cso["current_fn"]} false negatives)
-            </div>
-            <div style='font-size: 14px; color: {COLORS["primary"]}; margin-bottom: 12px;'>
-                <strong>Gap:</strong> +{cso["fn_gap"]} missed risks (+{cso["fn_gap_pct"]:.0f}% more)
-            </div>
-            <div style='
-                font-size: 14px;
-                color: #555;
-                font-style: italic;
-                border-left: 3px solid {COLORS["secondary"]};
-                padding-left: 10px;
-            '>
-                "{cso["quote"]}"
-            </div>
-        </div>
-        """,
+        _CSO_CARD_TMPL.format_map(cso | {"threshold": threshold}),
         unsafe_allow_html=True
     )
 
@@ -348,31 +447,7 @@ def render_cso_card(cso: dict, threshold: float):
 def render_relations_card(relations: dict):
     """Render the Supplier Relations perspective card."""
     st.markdown(
-        f"""
-        <div style='
-            border: 1px solid {COLORS["neutral"]};
-            border-radius: 10px;
-            padding: 15px;
-            margin-bottom: 10px;
-            background-color: white;
-        '>
-            <div style='font-size: 16px; font-weight: bold; color: {COLORS["primary"]}; border-bottom: 1px solid {COLORS["neutral"]}; padding-bottom: 8px; margin-bottom: 10px;'>
-                {relations["role"]} ({relations["name"]}) - {relations["focus"]}
-            </div>
-            <div style='font-size: 14px; color: {COLORS["primary"]}; margin-bottom: 12px;'>
-                <strong>Current:</strong> {relations["flagged_pct"]:.0f}% flagged ({relations["flagged_count"]} suppliers)
-            </div>
-            <div style='
-                font-size: 14px;
-                color: #555;
-                font-style: italic;
-                border-left: 3px solid {COLORS["secondary"]};
-                padding-left: 10px;
-            '>
-                "{relations["quote"]}"
-            </div>
-        </div>
-        """,
+        _RELATIONS_CARD_TMPL.format_map(relations),
         unsafe_allow_html=True
     )
 
@@ -380,71 +455,25 @@ def render_relations_card(relations: dict):
 def render_counsel_card(counsel: dict):
     """Render the General Counsel perspective card."""
     st.markdown(
-        f"""
-        <div style='
-            border: 1px solid {COLORS["neutral"]};
-            border-radius: 10px;
-            padding: 15px;
-            margin-bottom: 10px;
-            background-color: white;
-        '>
-            <div style='font-size: 16px; font-weight: bold; color: {COLORS["primary"]}; border-bottom: 1px solid {COLORS["neutral"]}; padding-bottom: 8px; margin-bottom: 10px;'>
-                {counsel["role"]} ({counsel["name"]}) - {counsel["focus"]}
-            </div>
-            <div style='font-size: 14px; color: {COLORS["primary"]}; margin-bottom: 6px;'>
-                <strong>Geographic disparity:</strong> {counsel["disparity"]:.1f} percentage points
-            </div>
-            <div style='font-size: 13px; color: {COLORS["primary"]}; margin-bottom: 4px;'>
-                (China: {counsel["china_rate"]:.1f}% | n=1,172)
-            </div>
-            <div style='font-size: 13px; color: {COLORS["primary"]}; margin-bottom: 4px;'>
-                (India: {counsel["india_rate"]:.1f}% | n=60)
-            </div>
-            <div style='font-size: 13px; color: {COLORS["primary"]}; margin-bottom: 12px;'>
-                (Other: {counsel["other_rate"]:.1f}% | n=14)
-            </div>
-            <div style='
-                font-size: 14px;
-                color: #555;
-                font-style: italic;
-                border-left: 3px solid {COLORS["secondary"]};
-                padding-left: 10px;
-            '>
-                "{counsel["quote"]}"
-            </div>
-        </div>
-        """,
+        _COUNSEL_CARD_TMPL.format_map(counsel),
         unsafe_allow_html=True
     )
 
 
+# Stakeholder cards in display order as (perspective key, renderer, whether
+# the renderer also takes the current threshold)
+_CARD_RENDERERS = [
+    ("cfo", render_cfo_card, True),
+    ("cso", render_cso_card, True),
+    ("relations", render_relations_card, False),
+    ("counsel", render_counsel_card, False),
+]
+
+
 def render_discussion_prompts():
     """Render the case discussion prompts."""
     with st.expander("📝 Discussion Questions"):
-        st.markdown("""
-        Use these questions to guide your case analysis:
-
-        1. **Stakeholder Priorities:** Which stakeholder's concerns should matter most to Philips?
-           How would you weigh cost savings against risk mitigation?
-
-        2. **Geographic Fairness:** Is the disparity in flagging rates between regions acceptable?
-           Why or why not? What are the ethical implications?
-
-        3. **Regional Thresholds:** Should Philips consider using different thresholds by region
-           to achieve more equitable outcomes? What are the trade-offs?
-
-        4. **Worst Case Scenario:** What would happen if Philips misses a major sustainability
-           violation at a supplier? How should this risk factor into the threshold decision?
-
-        5. **Board Justification:** How would you justify your recommended threshold to the
-           Philips board of directors? What data would you present?
-
-        6. **Implementation:** Beyond the threshold, what other safeguards or processes should
-           Philips implement to manage supplier sustainability risk?
-
-        7. **Model Limitations:** What are the limitations of using a predictive model for this
-           decision? When might human judgment be more appropriate?
-        """)
+        st.markdown(_DISCUSSION_PROMPTS_MD)
 
 
 def main():
@@ -452,15 +481,15 @@ def main():
     # Render header
     render_header()
 
-    st.markdown("---")
-
     # Threshold selector
     threshold = render_threshold_selector()
 
-    st.markdown("---")
+    # Look up the threshold's data once and share it across sections
+    metrics = get_metrics_for_threshold(threshold)
+    rates = get_geographic_rates_for_threshold(threshold)
 
     # Key metrics
-    render_metric_cards(threshold)
+    render_metric_cards(threshold, metrics)
 
     st.markdown("---")
 
@@ -471,12 +500,10 @@ def main():
         render_cost_risk_chart(threshold)
 
     with col_right:
-        render_geographic_fairness_chart(threshold)
-
-    st.markdown("---")
+        render_geographic_fairness_chart(threshold, rates)
 
     # Stakeholder perspectives (neutral comparison cards)
-    render_stakeholder_perspectives(threshold)
+    render_stakeholder_perspectives(threshold, metrics, rates)
 
     st.markdown("---")
 
@@ -60,6 +60,12 @@ GEOGRAPHIC_FAIRNESS: Dict[str, Dict[float, float]] = {
     "Other": {0.50: 42.9, 0.60: 84.6, 0.70: 92.9}
 }
 
+# Regional flagging rates keyed by exhibit threshold (0.50, 0.60, 0.70)
+GEO_RATES_AT_STANDARD: Dict[float, Dict[str, float]] = {
+    threshold: {region: rates[threshold] for region, rates in GEOGRAPHIC_FAIRNESS.items()}
+    for threshold in GEOGRAPHIC_FAIRNESS["China"]
+}
+
 # Sample sizes by region - important for statistical significance
 # Note: "Other" has very small sample size (n=14)
 SAMPLE_SIZES: Dict[str, int] = {
@@ -70,6 +76,8 @@ SAMPLE_SIZES: Dict[str, int] = {
 
 # Standard thresholds that have actual model output (not interpolated)
 STANDARD_THRESHOLDS = [0.50, 0.55, 0.60, 0.65, 0.70]
+STANDARD_THRESHOLDS_SET = frozenset(STANDARD_THRESHOLDS)
+STANDARD_THRESHOLDS_DISPLAY = ", ".join(f"{t:.2f}" for t in STANDARD_THRESHOLDS)
 
 # Stakeholder preference thresholds
 STAKEHOLDER_PREFERENCES = {
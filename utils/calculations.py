@@ -4,20 +4,47 @@ Metric calculations and interpolation logic for the Philips Threshold Dashboard.
 This module handles:
 - Linear interpolation for non-standard threshold values
 - Neutral stakeholder perspective data (no status indicators)
+- Precomputed metric tables for the slider's threshold grid
 - Metric retrieval and caching
 """
 
-from typing import Dict, Any, Tuple, Optional
+from typing import Dict, Any, NamedTuple, Tuple, Optional, Union
 import numpy as np
 import streamlit as st
 
 from data.exhibits import (
     THRESHOLDS,
     GEOGRAPHIC_FAIRNESS,
+    GEO_RATES_AT_STANDARD,
     STANDARD_THRESHOLDS,
-    TOTAL_SUPPLIERS
+    STANDARD_THRESHOLDS_SET
 )
 
+# Balanced threshold that metric deltas are reported against
+_REFERENCE_THRESHOLD = 0.60
+_REFERENCE_METRICS = THRESHOLDS[_REFERENCE_THRESHOLD]
+
+# Metrics included in the delta vs the reference threshold
+_DELTA_KEYS = (
+    "flagged",
+    "flagged_pct",
+    "cost",
+    "false_positives",
+    "false_negatives",
+    "accuracy"
+)
+
+# Standard thresholds sorted once for bracketing lookups
+_SORTED_STD = np.asarray(sorted(STANDARD_THRESHOLDS))
+
+# Exhibit metrics as a (standard thresholds x metrics) matrix, rows in
+# _SORTED_STD order, so all metrics interpolate in one vectorized step
+_METRIC_KEYS = tuple(THRESHOLDS[0.50])
+_METRIC_MATRIX = np.array([
+    [THRESHOLDS[t][key] for key in _METRIC_KEYS]
+    for t in _SORTED_STD
+])
+
 
 def is_standard_threshold(threshold: float) -> bool:
     """
@@ -29,7 +56,18 @@ def is_standard_threshold(threshold: float) -> bool:
     Returns:
         True if threshold is a standard value, False otherwise
     """
-    return threshold in STANDARD_THRESHOLDS
+    # Round to the slider step so float noise (e.g. 0.5000000001) still matches
+    return round(threshold, 2) in STANDARD_THRESHOLDS_SET
+
+
+def _bracket_index(threshold: Union[float, np.ndarray]) -> Union[int, np.ndarray]:
+    """Index of the lower bracketing standard threshold (scalar or array)."""
+    # Thresholds outside the standard range use the outermost pair
+    return np.clip(
+        np.searchsorted(_SORTED_STD, threshold, side="right") - 1,
+        0,
+        len(_SORTED_STD) - 2
+    )
 
 
 def get_neighboring_thresholds(threshold: float) -> Tuple[float, float]:
@@ -42,21 +80,8 @@ def get_neighboring_thresholds(threshold: float) -> Tuple[float, float]:
     Returns:
         Tuple of (lower_threshold, upper_threshold)
     """
-    sorted_thresholds = sorted(STANDARD_THRESHOLDS)
-
-    # Handle edge cases
-    if threshold <= sorted_thresholds[0]:
-        return sorted_thresholds[0], sorted_thresholds[1]
-    if threshold >= sorted_thresholds[-1]:
-        return sorted_thresholds[-2], sorted_thresholds[-1]
-
-    # Find bracketing thresholds
-    for i in range(len(sorted_thresholds) - 1):
-        if sorted_thresholds[i] <= threshold <= sorted_thresholds[i + 1]:
-            return sorted_thresholds[i], sorted_thresholds[i + 1]
-
-    # Fallback (shouldn't reach here)
-    return sorted_thresholds[0], sorted_thresholds[-1]
+    i = _bracket_index(threshold)
+    return float(_SORTED_STD[i]), float(_SORTED_STD[i + 1])
 
 
 def interpolate_value(
@@ -86,46 +111,40 @@ def interpolate_value(
     return lower_val + ratio * (upper_val - lower_val)
 
 
-@st.cache_data
-def get_metrics_for_threshold(threshold: float) -> Dict[str, Any]:
+def _interpolate_metric_matrix(thresholds: np.ndarray) -> np.ndarray:
     """
-    Get all metrics for a given threshold, using interpolation if needed.
+    Linearly interpolate all metrics between the bracketing standard thresholds.
 
     Args:
-        threshold: The threshold value (0.45 to 0.75)
+        thresholds: 1-D array of threshold values
 
     Returns:
-        Dictionary with all metrics for the threshold
+        Array of shape (len(thresholds), len(_METRIC_KEYS)) with unrounded metrics
     """
-    # If it's a standard threshold, return exact values
-    if is_standard_threshold(threshold):
-        return THRESHOLDS[threshold].copy()
+    i = _bracket_index(thresholds)
+    lower_thresh, upper_thresh = _SORTED_STD[i], _SORTED_STD[i + 1]
+    ratio = ((thresholds - lower_thresh) / (upper_thresh - lower_thresh))[:, np.newaxis]
+    lower_vals, upper_vals = _METRIC_MATRIX[i], _METRIC_MATRIX[i + 1]
+    return lower_vals + ratio * (upper_vals - lower_vals)
 
-    # Otherwise, interpolate
-    lower_thresh, upper_thresh = get_neighboring_thresholds(threshold)
-    lower_metrics = THRESHOLDS[lower_thresh]
-    upper_metrics = THRESHOLDS[upper_thresh]
 
-    interpolated = {}
-    for key in lower_metrics:
-        interpolated[key] = interpolate_value(
-            threshold,
-            lower_thresh,
-            upper_thresh,
-            lower_metrics[key],
-            upper_metrics[key]
-        )
-        # Round certain metrics to integers
-        if key in ["flagged", "false_positives", "false_negatives"]:
-            interpolated[key] = int(round(interpolated[key]))
+def _interpolate_metrics(threshold: float) -> Dict[str, float]:
+    """
+    Linearly interpolate all metrics for a single threshold.
+
+    Args:
+        threshold: The threshold value
 
-    return interpolated
+    Returns:
+        Dictionary with unrounded interpolated metrics
+    """
+    values = _interpolate_metric_matrix(np.array([threshold]))[0]
+    return dict(zip(_METRIC_KEYS, values.tolist()))
 
 
-def get_geographic_rates_for_threshold(threshold: float) -> Dict[str, float]:
+def _interpolate_geographic_rates(threshold: float) -> Dict[str, float]:
     """
-    Get geographic flagging rates for a given threshold.
-    Uses interpolation for non-standard thresholds.
+    Interpolate geographic flagging rates between the 0.50/0.60/0.70 exhibits.
 
     Args:
         threshold: The threshold value
@@ -133,11 +152,9 @@ def get_geographic_rates_for_threshold(threshold: float) -> Dict[str, float]:
     Returns:
         Dictionary mapping region to flagging rate
     """
-    geo_thresholds = [0.50, 0.60, 0.70]
-
     # If exact match, return directly
-    if threshold in geo_thresholds:
-        return {region: rates[threshold] for region, rates in GEOGRAPHIC_FAIRNESS.items()}
+    if threshold in GEO_RATES_AT_STANDARD:
+        return GEO_RATES_AT_STANDARD[threshold].copy()
 
     # Find neighboring thresholds
     if threshold < 0.50:
@@ -162,6 +179,136 @@ def get_geographic_rates_for_threshold(threshold: float) -> Dict[str, float]:
     return result
 
 
+# Slider grid (0.45 to 0.75 in 0.01 steps) with every metric precomputed,
+# so per-rerun lookups are a single array index instead of interpolation
+THRESHOLD_GRID = np.round(np.arange(0.45, 0.7501, 0.01), 2)
+
+# Metrics reported as whole supplier counts
+_INTEGER_METRICS = ("flagged", "false_positives", "false_negatives")
+
+
+def _build_metric_tables() -> Dict[str, np.ndarray]:
+    """Interpolate every metric at each point of THRESHOLD_GRID."""
+    grid_metrics = _interpolate_metric_matrix(THRESHOLD_GRID)
+    return {key: grid_metrics[:, j] for j, key in enumerate(_METRIC_KEYS)}
+
+
+def _build_geo_tables() -> Dict[str, np.ndarray]:
+    """Interpolate every regional flagging rate at each point of THRESHOLD_GRID."""
+    grid_rates = [_interpolate_geographic_rates(t) for t in THRESHOLD_GRID]
+    return {
+        region: np.array([rates[region] for rates in grid_rates])
+        for region in GEOGRAPHIC_FAIRNESS
+    }
+
+
+class _ThresholdTables(NamedTuple):
+    """Precomputed values at each point of THRESHOLD_GRID."""
+    metrics: Dict[str, np.ndarray]  # Metric name -> values
+    geo: Dict[str, np.ndarray]      # Region -> flagging rates
+    geo_disparity: np.ndarray       # Spread across regions per threshold
+
+
+@st.cache_resource
+def _get_tables() -> _ThresholdTables:
+    """
+    Build the precomputed threshold tables.
+
+    Built lazily on first lookup rather than at import so it doesn't delay
+    the first paint, then shared read-only across all sessions.
+
+    Returns:
+        _ThresholdTables for THRESHOLD_GRID
+    """
+    geo = _build_geo_tables()
+    # Regions x grid matrix, so the spread across regions is one np.ptp call
+    geo_matrix = np.vstack(list(geo.values()))
+    return _ThresholdTables(
+        metrics=_build_metric_tables(),
+        geo=geo,
+        geo_disparity=np.ptp(geo_matrix, axis=0)
+    )
+
+
+def _grid_index(threshold: float) -> Optional[int]:
+    """
+    Find the position of a threshold in THRESHOLD_GRID.
+
+    Args:
+        threshold: The threshold value
+
+    Returns:
+        Index into the precomputed tables, or None if the threshold is off-grid
+    """
+    idx = int(round((threshold - 0.45) * 100))
+    if 0 <= idx < len(THRESHOLD_GRID) and abs(THRESHOLD_GRID[idx] - threshold) < 1e-9:
+        return idx
+    return None
+
+
+@st.cache_data
+def get_metrics_for_threshold(threshold: float) -> Dict[str, Any]:
+    """
+    Get all metrics for a given threshold, using interpolation if needed.
+
+    Args:
+        threshold: The threshold value (0.45 to 0.75)
+
+    Returns:
+        Dictionary with all metrics for the threshold
+    """
+    # If it's a standard threshold, return exact values. The copy only runs on
+    # a cache miss, and st.cache_data returns that first result uncopied, so
+    # it keeps callers from ever holding the exhibit dict itself.
+    if is_standard_threshold(threshold):
+        return THRESHOLDS[round(threshold, 2)].copy()
+
+    # Otherwise, look up the precomputed interpolation (or compute it off-grid)
+    idx = _grid_index(threshold)
+    if idx is None:
+        metrics = _interpolate_metrics(threshold)
+    else:
+        metric_tables = _get_tables().metrics
+        metrics = {key: float(table[idx]) for key, table in metric_tables.items()}
+
+    # Round certain metrics to integers
+    for key in _INTEGER_METRICS:
+        metrics[key] = int(round(metrics[key]))
+
+    return metrics
+
+
+@st.cache_data(max_entries=64)
+def get_geographic_rates_for_threshold(threshold: float) -> Dict[str, float]:
+    """
+    Get geographic flagging rates for a given threshold.
+    Uses interpolation for non-standard thresholds.
+
+    Args:
+        threshold: The threshold value
+
+    Returns:
+        Dictionary mapping region to flagging rate
+    """
+    # Exhibit thresholds come straight from the case data (copied, as with
+    # get_metrics_for_threshold, since a cache miss returns it uncopied)
+    geo_key = round(threshold, 2)
+    if geo_key in GEO_RATES_AT_STANDARD:
+        return GEO_RATES_AT_STANDARD[geo_key].copy()
+
+    idx = _grid_index(threshold)
+    if idx is None:
+        return _interpolate_geographic_rates(threshold)
+
+    return {region: float(table[idx]) for region, table in _get_tables().geo.items()}
+
+
+def _disparity_from_rates(rates: Dict[str, float]) -> float:
+    """Return the spread between the highest and lowest regional rates."""
+    return max(rates.values()) - min(rates.values())
+
+
+@st.cache_data(max_entries=64)
 def calculate_geographic_disparity(threshold: float) -> float:
     """
     Calculate the maximum disparity in flagging rates across regions.
@@ -172,11 +319,19 @@ def calculate_geographic_disparity(threshold: float) -> float:
     Returns:
         The difference between max and min regional flagging rates
     """
-    rates = get_geographic_rates_for_threshold(threshold)
-    return max(rates.values()) - min(rates.values())
+    idx = _grid_index(threshold)
+    if idx is None:
+        return _disparity_from_rates(get_geographic_rates_for_threshold(threshold))
 
+    return float(_get_tables().geo_disparity[idx])
 
-def get_stakeholder_perspectives(threshold: float) -> Dict[str, Dict[str, Any]]:
+
+@st.cache_data(max_entries=64)
+def get_stakeholder_perspectives(
+    threshold: float,
+    metrics: Optional[Dict[str, Any]] = None,
+    rates: Optional[Dict[str, float]] = None
+) -> Dict[str, Dict[str, Any]]:
     """
     Get neutral stakeholder perspective data for a given threshold.
 
@@ -185,13 +340,17 @@ def get_stakeholder_perspectives(threshold: float) -> Dict[str, Dict[str, Any]]:
 
     Args:
         threshold: The threshold value
+        metrics: Metrics for the threshold, if already looked up
+        rates: Geographic flagging rates for the threshold, if already looked up
 
     Returns:
         Dictionary with perspective data for each stakeholder
     """
-    metrics = get_metrics_for_threshold(threshold)
-    disparity = calculate_geographic_disparity(threshold)
-    geo_rates = get_geographic_rates_for_threshold(threshold)
+    if metrics is None:
+        metrics = get_metrics_for_threshold(threshold)
+    if rates is None:
+        rates = get_geographic_rates_for_threshold(threshold)
+    disparity = _disparity_from_rates(rates)
 
     # CFO reference values (prefers threshold 0.50)
     cfo_preferred_cost = 4.6  # Cost at threshold 0.50
@@ -239,36 +398,28 @@ def get_stakeholder_perspectives(threshold: float) -> Dict[str, Dict[str, Any]]:
             "role": "General Counsel",
             "focus": "Fairness",
             "disparity": disparity,
-            "china_rate": geo_rates.get("China", 0),
-            "india_rate": geo_rates.get("India", 0),
-            "other_rate": geo_rates.get("Other", 0),
+            "china_rate": rates.get("China", 0),
+            "india_rate": rates.get("India", 0),
+            "other_rate": rates.get("Other", 0),
             "quote": "If the model systematically flags certain regions at higher rates not because of actual sustainability differences but because of training data limitations, we have both a legal risk and an ethical problem."
         }
     }
 
 
-def get_delta_vs_reference(
-    current_threshold: float,
-    reference_threshold: float = 0.60
-) -> Dict[str, float]:
+@st.cache_data(max_entries=64)
+def get_delta_vs_reference(current_threshold: float) -> Dict[str, float]:
     """
-    Calculate the delta (change) in metrics vs a reference threshold.
+    Calculate the delta (change) in metrics vs the 0.60 reference threshold.
 
     Args:
         current_threshold: The current threshold value
-        reference_threshold: The reference threshold to compare against
 
     Returns:
         Dictionary with delta values for key metrics
     """
     current = get_metrics_for_threshold(current_threshold)
-    reference = get_metrics_for_threshold(reference_threshold)
 
     return {
-        "flagged": current["flagged"] - reference["flagged"],
-        "flagged_pct": current["flagged_pct"] - reference["flagged_pct"],
-        "cost": current["cost"] - reference["cost"],
-        "false_positives": current["false_positives"] - reference["false_positives"],
-        "false_negatives": current["false_negatives"] - reference["false_negatives"],
-        "accuracy": current["accuracy"] - reference["accuracy"]
+        key: current[key] - _REFERENCE_METRICS[key]
+        for key in _DELTA_KEYS
     }
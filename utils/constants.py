@@ -0,0 +1,19 @@
+"""
+Shared display constants for the Philips Threshold Dashboard.
+
+Kept free of heavy imports so the app can style its layout without
+loading Plotly.
+"""
+
+from typing import Dict
+
+# Philips brand colors
+COLORS: Dict[str, str] = {
+    "primary": "#0E1C36",      # Philips dark blue
+    "secondary": "#00629B",    # Philips light blue
+    "positive": "#00A651",     # Green
+    "negative": "#E4002B",     # Red
+    "neutral": "#F0F0F0",      # Light gray
+    "warning": "#FFC107",      # Yellow/amber
+    "highlight": "#00629B",    # Highlight color (light blue)
+}
@@ -6,9 +6,12 @@ This module provides chart generation functions for:
 - Geographic Fairness horizontal bar chart
 """
 
-from typing import Dict, List, Optional
+import copy
+from functools import lru_cache
+from types import MappingProxyType
+import numpy as np
 import plotly.graph_objects as go
-import plotly.express as px
+import plotly.io as pio
 import streamlit as st
 
 from data.exhibits import (
@@ -17,225 +20,304 @@ from data.exhibits import (
     SAMPLE_SIZES,
     STANDARD_THRESHOLDS
 )
-from utils.calculations import (
-    get_metrics_for_threshold,
-    get_geographic_rates_for_threshold
+from utils.calculations import get_metrics_for_threshold
+from utils.constants import COLORS
+
+# Serialize figures with orjson when available; st.plotly_chart encodes the
+# full figure on every rerun and the stdlib encoder is several times slower
+try:
+    import orjson  # noqa: F401
+except ImportError:
+    pass
+else:
+    pio.json.config.default_engine = "orjson"
+
+# Brand colors used by the charts, bound once from COLORS
+_C_PRIMARY = COLORS["primary"]
+_C_NEGATIVE = COLORS["negative"]
+_C_NEUTRAL = COLORS["neutral"]
+_C_HIGHLIGHT = COLORS["highlight"]
+
+# Chart series that never change at runtime, built once at import as NumPy
+# arrays (which Plotly serializes as compact typed arrays)
+_SORTED_THR = np.array(sorted(STANDARD_THRESHOLDS), dtype=np.float64)
+_FRONTIER = np.fromiter(
+    ((THRESHOLDS[t]["cost"], THRESHOLDS[t]["false_negatives"]) for t in _SORTED_THR),
+    dtype=np.dtype([("cost", np.float64), ("false_negatives", np.int32)]),
+    count=len(_SORTED_THR)
+)
+_COSTS = _FRONTIER["cost"]
+_FN = _FRONTIER["false_negatives"]
+
+# Position of each standard threshold in the series above, keyed in
+# hundredths for exact integer lookup of the quantized selected threshold
+_SORTED_THR_KEYS = np.rint(_SORTED_THR * 100).astype(np.int64)
+_THR_IDX = {key: i for i, key in enumerate(_SORTED_THR_KEYS.tolist())}
+
+_REGIONS = list(GEOGRAPHIC_FAIRNESS.keys())
+_GEO_THRESHOLDS = np.array([0.50, 0.60, 0.70])
+_GEO_THR_KEYS = np.rint(_GEO_THRESHOLDS * 100).astype(np.int64)
+
+# Regional flagging rates as a (regions x thresholds) matrix
+_GEO_MATRIX = np.array(
+    [[GEOGRAPHIC_FAIRNESS[region][t] for t in _GEO_THRESHOLDS] for region in _REGIONS],
+    dtype=np.float64
 )
 
-# Philips brand colors
-COLORS = {
-    "primary": "#0E1C36",      # Philips dark blue
-    "secondary": "#00629B",    # Philips light blue
-    "positive": "#00A651",     # Green
-    "negative": "#E4002B",     # Red
-    "neutral": "#F0F0F0",      # Light gray
-    "warning": "#FFC107",      # Yellow/amber
-    "highlight": "#00629B",    # Highlight color (light blue)
-}
-
+# Hover templates, filled in client-side from each trace's own data
+_HOVER_TMPL = (
+    "<b>Threshold: %{customdata[0]:.2f}</b><br>"
+    "Cost: $%{x:.1f}M<br>"
+    "False Negatives: %{y}<br>"
+    "<extra></extra>"
+)
+_INTERPOLATED_HOVER_TMPL = (
+    "<b>Threshold: %{customdata[0]:.2f} (interpolated)</b><br>"
+    "Cost: $%{x:.1f}M<br>"
+    "False Negatives: %{y}<br>"
+    "<extra></extra>"
+)
+_GEO_HOVER_TMPL = (
+    "<b>Threshold: %{meta:.2f}</b><br>"
+    "%{y}: %{x:.1f}%<br>"
+    "<extra></extra>"
+)
 
-@st.cache_data
-def create_cost_risk_chart(selected_threshold: float) -> go.Figure:
-    """
-    Create a scatter plot showing the cost vs. risk trade-off.
+# Bar colors for each threshold (gradient from light to dark)
+_BAR_COLORS = MappingProxyType({
+    0.50: "#B3D9E8",  # Light blue
+    0.60: "#5BA3C6",  # Medium blue
+    0.70: "#0E1C36",  # Dark blue (Philips primary)
+})
+
+# Bar label colors for each threshold, white on the darkest bars
+_TEXT_COLORS = MappingProxyType({
+    0.50: _C_PRIMARY,
+    0.60: _C_PRIMARY,
+    0.70: "white",
+})
+
+# Attributes shared by every geographic bar trace
+_GEO_BAR_STYLE = MappingProxyType(dict(
+    type="bar",
+    y=_REGIONS,
+    orientation="h",
+    textposition="auto",
+    hovertemplate=_GEO_HOVER_TMPL
+))
+
+# Sample size annotations, flagging regions too small for reliable rates
+_GEO_ANNOTATIONS = [
+    dict(
+        text=f"n={SAMPLE_SIZES[region]}{' ⚠️' if SAMPLE_SIZES[region] < 30 else ''}",
+        x=98,
+        y=region,
+        showarrow=False,
+        font=dict(
+            size=10,
+            color=_C_NEGATIVE if SAMPLE_SIZES[region] < 30 else _C_PRIMARY
+        ),
+        xanchor="right"
+    )
+    for region in _REGIONS[::-1]
+]
 
-    X-axis: Annual Cost ($M)
-    Y-axis: False Negatives (missed risks)
-    Points represent all standard thresholds with the selected one highlighted.
 
-    Args:
-        selected_threshold: The currently selected threshold value
+@lru_cache(maxsize=None)
+def _cost_risk_base_figdict() -> dict:
+    """
+    Build the cost vs. risk figure dict with no threshold selected.
 
     Returns:
-        Plotly Figure object
+        Figure dict with the frontier, all standard threshold markers,
+        layout and annotation (shared, do not mutate)
     """
-    # Prepare data for all standard thresholds
-    costs = []
-    false_negatives = []
-    thresholds = []
-
-    for thresh in sorted(STANDARD_THRESHOLDS):
-        metrics = THRESHOLDS[thresh]
-        costs.append(metrics["cost"])
-        false_negatives.append(metrics["false_negatives"])
-        thresholds.append(thresh)
-
-    # Create figure
-    fig = go.Figure()
-
-    # Add line connecting all points (trade-off frontier)
-    fig.add_trace(go.Scatter(
-        x=costs,
-        y=false_negatives,
-        mode="lines",
-        line=dict(color=COLORS["neutral"], width=2, dash="dot"),
-        showlegend=False,
-        hoverinfo="skip"
-    ))
-
-    # Add points for all thresholds
-    for i, thresh in enumerate(thresholds):
-        is_selected = abs(thresh - selected_threshold) < 0.01
-        marker_size = 20 if is_selected else 12
-        marker_color = COLORS["highlight"] if is_selected else COLORS["primary"]
-        marker_symbol = "star" if is_selected else "circle"
-
-        fig.add_trace(go.Scatter(
-            x=[costs[i]],
-            y=[false_negatives[i]],
-            mode="markers+text",
-            marker=dict(
-                size=marker_size,
-                color=marker_color,
-                symbol=marker_symbol,
-                line=dict(width=2, color="white")
-            ),
-            text=[f"{thresh:.2f}"],
-            textposition="top center",
-            textfont=dict(size=12, color=COLORS["primary"]),
-            name=f"Threshold {thresh:.2f}",
-            hovertemplate=(
-                f"<b>Threshold: {thresh:.2f}</b><br>"
-                f"Cost: ${costs[i]:.1f}M<br>"
-                f"False Negatives: {false_negatives[i]}<br>"
-                "<extra></extra>"
-            )
-        ))
-
-    # Add selected threshold if it's not a standard one
-    if selected_threshold not in STANDARD_THRESHOLDS:
-        sel_metrics = get_metrics_for_threshold(selected_threshold)
-        fig.add_trace(go.Scatter(
-            x=[sel_metrics["cost"]],
-            y=[sel_metrics["false_negatives"]],
+    traces = [
+        # Line connecting all points (trade-off frontier)
+        dict(
+            type="scatter",
+            x=_COSTS,
+            y=_FN,
+            mode="lines",
+            line=dict(color=_C_NEUTRAL, width=2, dash="dot"),
+            showlegend=False,
+            hoverinfo="skip"
+        ),
+        # Points for all thresholds as a single static trace; the selection
+        # is drawn over it as a separate star trace
+        dict(
+            type="scatter",
+            x=_COSTS,
+            y=_FN,
             mode="markers+text",
             marker=dict(
-                size=20,
-                color=COLORS["highlight"],
-                symbol="star",
+                size=12,
+                color=_C_PRIMARY,
+                symbol="circle",
                 line=dict(width=2, color="white")
             ),
-            text=[f"{selected_threshold:.2f}*"],
+            text=[f"{thresh:.2f}" for thresh in _SORTED_THR],
             textposition="top center",
-            textfont=dict(size=12, color=COLORS["highlight"]),
-            name=f"Selected: {selected_threshold:.2f} (interpolated)",
-            hovertemplate=(
-                f"<b>Threshold: {selected_threshold:.2f} (interpolated)</b><br>"
-                f"Cost: ${sel_metrics['cost']:.1f}M<br>"
-                f"False Negatives: {sel_metrics['false_negatives']}<br>"
-                "<extra></extra>"
-            )
-        ))
-
-    # Update layout
-    fig.update_layout(
+            textfont=dict(size=12, color=_C_PRIMARY),
+            name="Standard thresholds",
+            customdata=_SORTED_THR[:, np.newaxis],
+            hovertemplate=_HOVER_TMPL
+        ),
+    ]
+
+    layout = dict(
         title=dict(
             text="Cost vs. Risk Trade-off",
-            font=dict(size=18, color=COLORS["primary"])
+            font=dict(size=18, color=_C_PRIMARY)
         ),
         xaxis=dict(
             title=dict(text="Annual Cost ($M)", font=dict(size=14)),
             range=[4, 8.5],
-            gridcolor=COLORS["neutral"],
+            gridcolor=_C_NEUTRAL,
             tickformat="$.1f"
         ),
         yaxis=dict(
             title=dict(text="False Negatives (Missed Risks)", font=dict(size=14)),
             range=[100, 230],
-            gridcolor=COLORS["neutral"]
+            gridcolor=_C_NEUTRAL
         ),
         showlegend=False,
         plot_bgcolor="white",
         margin=dict(l=60, r=40, t=60, b=60),
-        hovermode="closest"
-    )
-
-    # Add annotation for key insight
-    fig.add_annotation(
-        text="Lower is better on both axes<br>(but impossible to optimize both)",
-        xref="paper", yref="paper",
-        x=0.98, y=0.02,
-        showarrow=False,
-        font=dict(size=11, color=COLORS["primary"]),
-        align="right",
-        bgcolor="rgba(255,255,255,0.8)",
-        bordercolor=COLORS["neutral"],
-        borderwidth=1
+        hovermode="closest",
+        # Annotation for key insight
+        annotations=[dict(
+            text="Lower is better on both axes<br>(but impossible to optimize both)",
+            xref="paper", yref="paper",
+            x=0.98, y=0.02,
+            showarrow=False,
+            font=dict(size=11, color=_C_PRIMARY),
+            align="right",
+            bgcolor="rgba(255,255,255,0.8)",
+            bordercolor=_C_NEUTRAL,
+            borderwidth=1
+        )]
     )
 
-    return fig
+    return dict(data=traces, layout=layout)
 
 
-@st.cache_data
-def create_geographic_fairness_chart(selected_threshold: float) -> go.Figure:
+def create_cost_risk_chart(selected_threshold: float) -> go.Figure:
     """
-    Create a horizontal bar chart showing geographic flagging rates.
+    Create a scatter plot showing the cost vs. risk trade-off.
 
-    Groups bars by region, with different colors for each threshold level.
-    Highlights the selected threshold.
+    X-axis: Annual Cost ($M)
+    Y-axis: False Negatives (missed risks)
+    Points represent all standard thresholds with the selected one highlighted.
 
     Args:
         selected_threshold: The currently selected threshold value
 
     Returns:
-        Plotly Figure object
+        Plotly Figure object (shared from the cache, do not mutate)
     """
-    regions = list(GEOGRAPHIC_FAIRNESS.keys())
-    geo_thresholds = [0.50, 0.60, 0.70]
-
-    # Colors for each threshold (gradient from light to dark)
-    threshold_colors = {
-        0.50: "#B3D9E8",  # Light blue
-        0.60: "#5BA3C6",  # Medium blue
-        0.70: "#0E1C36",  # Dark blue (Philips primary)
-    }
+    return _create_cost_risk_chart(round(selected_threshold * 100))
+
+
+@st.cache_resource(max_entries=64)
+def _create_cost_risk_chart(threshold_key: int) -> go.Figure:
+    """Build the cost vs. risk chart for a threshold given in hundredths."""
+    selected_threshold = threshold_key / 100
+
+    # Highlight the selected standard threshold with a star over its point
+    i = _THR_IDX.get(threshold_key)
+    if i is not None:
+        selection = dict(
+            type="scatter",
+            x=_COSTS[i:i + 1],
+            y=_FN[i:i + 1],
+            mode="markers",
+            marker=dict(
+                size=20,
+                color=_C_HIGHLIGHT,
+                symbol="star",
+                line=dict(width=2, color="white")
+            ),
+            name=f"Selected: {selected_threshold:.2f}",
+            hoverinfo="skip"
+        )
+    else:
+        # Add selected threshold if it's not a standard one. Its position
+        # comes from get_metrics_for_threshold (a precomputed table lookup)
+        # rather than np.interp over the frontier, which would clamp at
+        # 0.50/0.70 instead of extrapolating and would not round false
+        # negatives like the metric cards.
+        sel_metrics = get_metrics_for_threshold(selected_threshold)
+        selection = dict(
+            type="scatter",
+            x=[sel_metrics["cost"]],
+            y=[sel_metrics["false_negatives"]],
+            mode="markers+text",
+            marker=dict(
+                size=20,
+                color=_C_HIGHLIGHT,
+                symbol="star",
+                line=dict(width=2, color="white")
+            ),
+            text=[f"{selected_threshold:.2f}*"],
+            textposition="top center",
+            textfont=dict(size=12, color=_C_HIGHLIGHT),
+            name=f"Selected: {selected_threshold:.2f} (interpolated)",
+            customdata=[[selected_threshold]],
+            hovertemplate=_INTERPOLATED_HOVER_TMPL
+        )
 
-    fig = go.Figure()
+    # Build the figure in one pass rather than validating incremental
+    # updates. go.Figure copies nested values but pops each trace's "type",
+    # so only the top-level trace dicts of the cached base are copied.
+    base = _cost_risk_base_figdict()
+    return go.Figure(dict(
+        data=[*(dict(trace) for trace in base["data"]), selection],
+        layout=base["layout"]
+    ))
 
-    # Add bars for each threshold
-    for thresh in geo_thresholds:
-        rates = [GEOGRAPHIC_FAIRNESS[region][thresh] for region in regions]
 
-        # Determine if this threshold should be highlighted
-        is_selected = abs(thresh - selected_threshold) < 0.06
+@lru_cache(maxsize=None)
+def _geographic_fairness_base_figdict() -> dict:
+    """
+    Build the geographic fairness figure dict with no threshold highlighted.
 
-        fig.add_trace(go.Bar(
-            y=regions,
+    Returns:
+        Figure dict with one bar trace per threshold, layout and
+        sample size annotations
+    """
+    # Bars for each threshold, one trace per threshold so each gets its
+    # own color and legend entry
+    traces = [
+        dict(
+            _GEO_BAR_STYLE,
             x=rates,
             name=f"Threshold {thresh:.2f}",
-            orientation="h",
             marker=dict(
-                color=threshold_colors[thresh],
-                line=dict(
-                    width=3 if is_selected else 0,
-                    color=COLORS["highlight"]
-                )
+                color=_BAR_COLORS[thresh],
+                line=dict(width=0, color=_C_HIGHLIGHT)
             ),
             text=[f"{r:.1f}%" for r in rates],
-            textposition="auto",
-            textfont=dict(color="white" if thresh == 0.70 else COLORS["primary"]),
-            hovertemplate=(
-                f"<b>Threshold: {thresh:.2f}</b><br>"
-                "%{y}: %{x:.1f}%<br>"
-                "<extra></extra>"
-            )
-        ))
-
-    # Update layout
-    fig.update_layout(
+            textfont=dict(color=_TEXT_COLORS[thresh]),
+            meta=thresh
+        )
+        for thresh, rates in zip(_GEO_THRESHOLDS, _GEO_MATRIX.T)
+    ]
+
+    layout = dict(
         title=dict(
             text="Geographic Flagging Rates by Threshold",
-            font=dict(size=18, color=COLORS["primary"])
+            font=dict(size=18, color=_C_PRIMARY)
         ),
         xaxis=dict(
             title=dict(text="Flagging Rate (%)", font=dict(size=14)),
             range=[0, 100],
-            gridcolor=COLORS["neutral"]
+            gridcolor=_C_NEUTRAL
         ),
         yaxis=dict(
             title="",
             categoryorder="array",
-            categoryarray=regions[::-1]  # Reverse for better display
+            categoryarray=_REGIONS[::-1]  # Reverse for better display
         ),
         barmode="group",
         legend=dict(
@@ -248,25 +330,38 @@ def create_geographic_fairness_chart(selected_threshold: float) -> go.Figure:
         plot_bgcolor="white",
         margin=dict(l=80, r=40, t=80, b=60),
         bargap=0.15,
-        bargroupgap=0.1
+        bargroupgap=0.1,
+        annotations=_GEO_ANNOTATIONS
     )
 
-    # Add sample size annotations
-    for i, region in enumerate(regions[::-1]):
-        n = SAMPLE_SIZES[region]
-        warning = " ⚠️" if n < 30 else ""
-        fig.add_annotation(
-            text=f"n={n}{warning}",
-            x=98,
-            y=region,
-            showarrow=False,
-            font=dict(
-                size=10,
-                color=COLORS["negative"] if n < 30 else COLORS["primary"]
-            ),
-            xanchor="right"
-        )
+    return dict(data=traces, layout=layout)
+
+
+def create_geographic_fairness_chart(selected_threshold: float) -> go.Figure:
+    """
+    Create a horizontal bar chart showing geographic flagging rates.
+
+    Groups bars by region, with different colors for each threshold level.
+    Highlights the selected threshold.
+
+    Args:
+        selected_threshold: The currently selected threshold value
+
+    Returns:
+        Plotly Figure object (shared from the cache, do not mutate)
+    """
+    return _create_geographic_fairness_chart(round(selected_threshold * 100))
+
 
-    return fig
+@st.cache_resource(max_entries=64)
+def _create_geographic_fairness_chart(threshold_key: int) -> go.Figure:
+    """Build the geographic fairness chart for a threshold given in hundredths."""
+    # Start from the cached base figure and only outline the selection
+    fig_dict = copy.deepcopy(_geographic_fairness_base_figdict())
 
+    # Outline the bars of thresholds within 0.05 of the selected one
+    selected = np.abs(_GEO_THR_KEYS - threshold_key) <= 5
+    for j in np.flatnonzero(selected):
+        fig_dict["data"][j]["marker"]["line"]["width"] = 3
 
+    return go.Figure(fig_dict)